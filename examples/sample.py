@@ -18,28 +18,22 @@ DEV_NAME_PREFIX = "gForceProX"
 DEV_MIN_RSSI = -64
 
 
-def convert_raw_emg_to_uv(
-    data: bytes, resolution: gforce.SampleResolution
-) -> np.ndarray[np.float32]:
-    min_voltage = -1.25  # volt
-    max_voltage = 1.25  # volt
-
-    match resolution:
-        case gforce.SampleResolution.BITS_8:
-            div = 127.0
-            sub = 128
-        case gforce.SampleResolution.BITS_12:
-            div = 2047.0
-            sub = 2048
-        case _:
-            raise Exception(f"Unsupported resolution {resolution}")
-
-    gain = 1200.0
-    conversion_factor = (max_voltage - min_voltage) / gain / div
-
-    emg_data = (data.astype(np.float32) - sub) * conversion_factor
-
-    return emg_data.reshape(-1, len(data))
+MIN_VOLTAGE = -1.25  # volt
+MAX_VOLTAGE = 1.25  # volt
+GAIN = 1200.0
+
+# Per-resolution affine coefficients, precomputed so the per-batch conversion
+# is a single multiply-add: uv = raw * scale + offset
+_RES_AFFINE = {
+    res: (
+        np.float32((MAX_VOLTAGE - MIN_VOLTAGE) / GAIN / div),
+        np.float32(-sub * (MAX_VOLTAGE - MIN_VOLTAGE) / GAIN / div),
+    )
+    for res, (div, sub) in {
+        gforce.SampleResolution.BITS_8: (127.0, 128),
+        gforce.SampleResolution.BITS_12: (2047.0, 2048),
+    }.items()
+}
 
 
 class Application:
@@ -47,6 +41,34 @@ class Application:
     def __init__(self):
         signal.signal(signal.SIGINT, lambda signal, frame: self._signal_handler())
         self.terminated = False
+        self._scale = None
+        self._offset = None
+        self._buf = np.empty(0, dtype=np.float32)
+        self._latest = None
+
+    def _set_resolution(self, resolution: gforce.SampleResolution):
+        try:
+            self._scale, self._offset = _RES_AFFINE[resolution]
+        except KeyError:
+            raise Exception(f"Unsupported resolution {resolution}")
+
+    def _convert_raw_emg_to_uv(self, data: np.ndarray) -> np.ndarray[np.float32]:
+        if self._buf.size < data.size:
+            self._buf = np.empty(data.size, dtype=np.float32)
+
+        out = self._buf[: data.size].reshape(data.shape)
+        np.multiply(data, self._scale, out=out)
+        np.add(out, self._offset, out=out)
+
+        return out
+
+    async def _printer(self):
+        # Prints a snapshot of the latest batch so the streaming loop never
+        # blocks on terminal I/O
+        while not self.terminated:
+            if self._latest is not None:
+                print(self._latest)
+            await asyncio.sleep(0.1)
 
     def _signal_handler(self):
         print("You pressed ctrl-c, exit")
@@ -55,6 +77,10 @@ class Application:
     async def main(self):
         gforce_device = gforce.GForce(DEV_NAME_PREFIX, DEV_MIN_RSSI)
 
+        # Best effort (Linux, root): shorten the connection interval for
+        # lower sample-arrival latency
+        gforce.set_connection_interval(7.5, 15.0)
+
         await gforce_device.connect()
         print("Connected to {0}".format(gforce_device.device_name))
 
@@ -67,13 +93,25 @@ class Application:
             gforce.DataSubscription.EMG_RAW | gforce.DataSubscription.ACCELERATE
         )
 
-        q = await gforce_device.start_streaming()
+        self._set_resolution(gforce_device.resolution)
+
+        q = await gforce_device.start_streaming(queue_size=4)
+
+        printer = asyncio.create_task(self._printer())
+
+        # Bind loop invariants to locals to keep lookups out of the hot loop
+        q_get = q.get
+        convert = self._convert_raw_emg_to_uv
 
         while not self.terminated:
-            v = await q.get()
-            v = convert_raw_emg_to_uv(v, gforce_device.resolution)
-            print(v)
+            # Drop all but the newest packet so a backlog never adds latency
+            while q.qsize() > 1:
+                q.get_nowait()
+
+            v = await q_get()
+            self._latest = convert(v)
 
+        await printer
         await gforce_device.stop_streaming()
         await gforce_device.disconnect()
 
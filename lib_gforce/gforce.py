@@ -1,6 +1,7 @@
 import asyncio
+import os
 import struct
-from asyncio import Queue
+from asyncio import Queue, QueueEmpty, QueueFull
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import IntEnum
@@ -20,6 +21,32 @@ CMD_NOTIFY_CHAR_UUID = "f000ffe1-0451-4000-b000-000000000000"
 DATA_NOTIFY_CHAR_UUID = "f000ffe2-0451-4000-b000-000000000000"
 
 
+def set_connection_interval(min_interval_ms, max_interval_ms, adapter="hci0"):
+    """Request a shorter BLE connection interval (Linux/BlueZ only).
+
+    Sample-arrival latency is dominated by the connection interval, which
+    defaults to 30-50 ms on most stacks. bleak exposes no API for it, so this
+    writes the BlueZ debugfs knobs (root required) that apply to connections
+    created afterwards - call it before connect(). Intervals are rounded to
+    the 1.25 ms units BLE uses. Returns False if the knobs are unavailable
+    (non-Linux or insufficient permissions). Note that shorter intervals
+    increase radio power draw on both ends.
+    """
+    min_units = max(6, round(min_interval_ms / 1.25))
+    max_units = max(min_units, round(max_interval_ms / 1.25))
+
+    path = "/sys/kernel/debug/bluetooth/{0}".format(adapter)
+    try:
+        with open(os.path.join(path, "conn_min_interval"), "w") as f:
+            f.write(str(min_units))
+        with open(os.path.join(path, "conn_max_interval"), "w") as f:
+            f.write(str(max_units))
+    except OSError:
+        return False
+
+    return True
+
+
 @dataclass
 class Characteristic:
     uuid: str
@@ -160,6 +187,12 @@ class SampleResolution(IntEnum):
     BITS_12 = 12
 
 
+_EMG_SAMPLE_DTYPES = {
+    SampleResolution.BITS_8: np.dtype("<u1"),
+    SampleResolution.BITS_12: np.dtype("<u2"),
+}
+
+
 class SamplingRate(IntEnum):
     HZ_500 = (500,)
     HZ_650 = (650,)
@@ -225,7 +258,7 @@ class GForce:
         self._min_rssi = min_rssi
 
         self.packet_id = 0
-        self.data_packet = []
+        self.data_packet = bytearray()
 
     def _match_device(self, _device: BLEDevice, adv: AdvertisementData):
         if (
@@ -261,7 +294,7 @@ class GForce:
 
     def _on_data_response(self, q: Queue, bs: bytearray):
         bs = bytes(bs)
-        full_packet = []
+        full_packet = b""
 
         is_partial_data = bs[0] == ResponseCode.PARTIAL_PACKET
         if is_partial_data:
@@ -278,8 +311,8 @@ class GForce:
                 self.data_packet += bs[2:]
 
                 if self.packet_id == 0:
-                    full_packet = self.data_packet
-                    self.data_packet = []
+                    full_packet = bytes(self.data_packet)
+                    self.data_packet = bytearray()
         else:
             full_packet = bs
 
@@ -327,18 +360,19 @@ class GForce:
                     f"Unknown data type {data_type}, full packet: {full_packet}"
                 )
 
-        q.put_nowait(data)
+        try:
+            q.put_nowait(data)
+        except QueueFull:
+            # Drop the oldest sample so the consumer always sees the freshest data
+            with suppress(QueueEmpty):
+                q.get_nowait()
+            q.put_nowait(data)
 
     def _convert_emg_to_raw(self, data: bytes) -> np.ndarray[np.integer]:
-        match self.resolution:
-            case SampleResolution.BITS_8:
-                dtype = np.uint8
-
-            case SampleResolution.BITS_12:
-                dtype = np.uint16
-
-            case _:
-                raise Exception(f"Unsupported resolution {self.resolution}")
+        try:
+            dtype = _EMG_SAMPLE_DTYPES[self.resolution]
+        except KeyError:
+            raise Exception(f"Unsupported resolution {self.resolution}")
 
         emg_data = np.frombuffer(data, dtype=dtype)
 
@@ -349,7 +383,7 @@ class GForce:
         normalizing_factor = 65536.0
 
         acceleration_data = (
-            np.frombuffer(data, dtype=np.int32).astype(np.float32) / normalizing_factor
+            np.frombuffer(data, dtype="<i4").astype(np.float32) / normalizing_factor
         )
         num_channels = 3
 
@@ -360,7 +394,7 @@ class GForce:
         normalizing_factor = 65536.0
 
         gyro_data = (
-            np.frombuffer(data, dtype=np.int32).astype(np.float32) / normalizing_factor
+            np.frombuffer(data, dtype="<i4").astype(np.float32) / normalizing_factor
         )
         num_channels = 3
 
@@ -371,7 +405,7 @@ class GForce:
         normalizing_factor = 65536.0
 
         magnetometer_data = (
-            np.frombuffer(data, dtype=np.int32).astype(np.float32) / normalizing_factor
+            np.frombuffer(data, dtype="<i4").astype(np.float32) / normalizing_factor
         )
         num_channels = 3
 
@@ -380,7 +414,7 @@ class GForce:
     @staticmethod
     def _convert_euler(data: bytes) -> np.ndarray[np.float32]:
 
-        euler_data = np.frombuffer(data, dtype=np.float32).astype(np.float32)
+        euler_data = np.frombuffer(data, dtype="<f4").astype(np.float32)
         num_channels = 3
 
         return euler_data.reshape(-1, num_channels)
@@ -388,7 +422,7 @@ class GForce:
     @staticmethod
     def _convert_quaternion(data: bytes) -> np.ndarray[np.float32]:
 
-        quaternion_data = np.frombuffer(data, dtype=np.float32).astype(np.float32)
+        quaternion_data = np.frombuffer(data, dtype="<f4").astype(np.float32)
         num_channels = 4
 
         return quaternion_data.reshape(-1, num_channels)
@@ -396,7 +430,7 @@ class GForce:
     @staticmethod
     def _convert_rotation_matrix(data: bytes) -> np.ndarray[np.float32]:
 
-        rotation_matrix_data = np.frombuffer(data, dtype=np.int32).astype(np.float32)
+        rotation_matrix_data = np.frombuffer(data, dtype="<i4").astype(np.float32)
         num_channels = 9
 
         return rotation_matrix_data.reshape(-1, num_channels)
@@ -404,7 +438,7 @@ class GForce:
     @staticmethod
     def _convert_emg_gesture(data: bytes) -> np.ndarray[np.float16]:
 
-        emg_gesture_data = np.frombuffer(data, dtype=np.int16).astype(np.float16)
+        emg_gesture_data = np.frombuffer(data, dtype="<i2").astype(np.float16)
         num_channels = 6
 
         return emg_gesture_data.reshape(-1, num_channels)
@@ -670,8 +704,8 @@ class GForce:
             )
         )
 
-    async def start_streaming(self) -> Queue:
-        q = Queue()
+    async def start_streaming(self, queue_size=0) -> Queue:
+        q = Queue(maxsize=queue_size)
         await self.client.start_notify(
             DATA_NOTIFY_CHAR_UUID,
             lambda _, data: self._on_data_response(q, data),